@@ -34,17 +34,24 @@ In order, this script does the following:
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import mmap
 from os import environ
+import shutil
 import subprocess
 import re
 
 VER_PATTERN = re.compile(
     r'^version = "(\d+)\.(\d+)\.(\d+)(?:\-rc)?(\d*)[^"]*" # auto', re.MULTILINE
 )
-VER_REPLACE = 'version = "%d.%d.%d%s" # auto'
 COMPONENTS = ("major", "minor", "patch", "rc")
-VERSION_LOG = re.compile(r"^## \[\d+\.\d+\.\d+(?:\-rc)?\d*\]")
+VERSION_LOG = re.compile(rb"^## \[\d+\.\d+\.\d+(?:\-rc)?\d*\]", re.MULTILINE)
+_CHANGELOG = Path(__file__).resolve().parents[2] / "CHANGELOG.md"
+
+# resolved once so the .cmd shims on Windows run without a cmd.exe shell
+YARN_EXE = shutil.which("yarn") or shutil.which("yarn.cmd") or "yarn"
+NAPI_EXE = shutil.which("napi") or shutil.which("napi.cmd") or "napi"
 
 
 class Updater:
@@ -53,13 +60,10 @@ class Updater:
 
     @staticmethod
     def replace(match: re.Match[str]) -> str:
-        ver = []
-        for v in match.groups():
-            try:
-                ver.append(int(v))
-            except ValueError:
-                ver.append(0)
-        old_version = ".".join([str(x) for x in ver[:3]])
+        g = match.group
+        # the rc group is empty (not absent) for non-rc versions
+        ver = [int(g(1)), int(g(2)), int(g(3)), int(g(4) or 0)]
+        old_version = ".".join(map(str, ver[:3]))
         rc_str = ""
         if ver[3] > 0:
             rc_str = f"-rc{ver[3]}"
@@ -69,31 +73,40 @@ class Updater:
         ver[index] += 1
         for i in range(index + 1, len(COMPONENTS)):
             ver[i] = 0
-        new_version = ".".join([str(x) for x in ver[:3]])
+        new_version = ".".join(map(str, ver[:3]))
         rc_str = f"-rc{ver[3]}" if ver[3] > 0 else ""
         new_version += rc_str
         print("new version:", new_version)
         Updater.new_version = new_version
-        return VER_REPLACE % (tuple(ver[:3]) + (rc_str,))
+        return f'version = "{ver[0]}.{ver[1]}.{ver[2]}{rc_str}" # auto'
 
 
 def get_release_notes(tag: str = Updater.new_version):
-    title, buf = "", ""
-    log_file = Path(__file__).parent.parent.parent / "CHANGELOG.md"
-    tag_pattern = f"[{tag}]"
-    with open(str(log_file), "r", encoding="utf-8") as logs:
-        found_notes = False
-        for line in logs:
-            matched = VERSION_LOG.match(line)
-            if matched is not None:
-                if tag_pattern in matched.group(0):
-                    title = tag + line[matched.end() :]
-                    found_notes = True
-                else:
-                    found_notes = False
-            elif found_notes:
-                buf += line
-    return title.rstrip(), buf.strip()
+    title, notes = "", ""
+    if not _CHANGELOG.stat().st_size:
+        # mmap rejects empty files; degrade to an empty release description
+        return title, notes
+    target = b"## [" + tag.encode("utf-8") + b"]"
+    notes_start = 0
+    with open(str(_CHANGELOG), "rb") as logs:
+        # One MULTILINE finditer pass over the mapped file locates the section
+        # boundaries by byte offset; the notes are a single slice between the
+        # target heading and the next version heading.
+        with mmap.mmap(logs.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            for matched in VERSION_LOG.finditer(view):
+                if title:
+                    notes = view[notes_start : matched.start()].decode("utf-8")
+                    break
+                if matched.group(0) == target:
+                    line_end = view.find(b"\n", matched.end())
+                    if line_end < 0:
+                        line_end = len(view)
+                    title = tag + view[matched.end() : line_end].decode("utf-8")
+                    notes_start = line_end + 1
+            else:
+                if title:
+                    notes = view[notes_start:].decode("utf-8")
+    return title.rstrip(), notes.strip()
 
 
 def main():
@@ -105,51 +118,79 @@ def main():
     doc = cargo_path.read_text(encoding="utf-8")
     doc = VER_PATTERN.sub(Updater.replace, doc)
     cargo_path.write_text(doc, encoding="utf-8", newline="\n")
-    subprocess.run(["cargo", "update", "--workspace"], check=True)
+
+    def update_cargo_lock():
+        subprocess.run(["cargo", "update", "--workspace"], check=True)
+
+    def update_node_versions():
+        subprocess.run(
+            [
+                YARN_EXE,
+                "version",
+                "--new-version",
+                Updater.new_version,
+                "--no-git-tag-version",
+            ],
+            cwd="bindings/node",
+            check=True,
+        )
+        subprocess.run([NAPI_EXE, "version"], cwd="bindings/node", check=True)
+
+    def update_changelog():
+        subprocess.run(
+            [
+                "git-cliff",
+                "--config",
+                ".config/cliff.toml",
+                "--tag",
+                f"v{Updater.new_version}",
+                "--output",
+                "CHANGELOG.md",
+            ],
+            check=True,
+        )
+
+    # these three chains touch disjoint files (Cargo.lock, the node
+    # package.json files, CHANGELOG.md) and the subprocess waits release the
+    # GIL, so they overlap cleanly on threads
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(update_cargo_lock),
+            executor.submit(update_node_versions),
+            executor.submit(update_changelog),
+        ]
+        for future in futures:
+            future.result()
     print("Updated version in Cargo.toml")
-    subprocess.run(
-        [
-            "yarn",
-            "version",
-            "--new-version",
-            Updater.new_version,
-            "--no-git-tag-version",
-        ],
-        cwd="bindings/node",
-        check=True,
-    )
-    subprocess.run(["napi", "version"], cwd="bindings/node", check=True, shell=True)
     print("Updated version in bindings/node/**package.json")
-
-    subprocess.run(
-        [
-            "git-cliff",
-            "--config",
-            ".config/cliff.toml",
-            "--tag",
-            f"v{Updater.new_version}",
-            "--output",
-            "CHANGELOG.md",
-        ],
-        check=True,
-    )
     print("Updated CHANGELOG.md")
 
+    git_env = None
     if environ.get("CI", "false") == "true":
-        # configure git credentials on CI runner
+        # configure git credentials on CI runner via per-invocation env vars
+        # (honored by git itself), avoiding any `git config` subprocesses
         # NOTE: this is design to fail locally with `KeyError`
-        git_config = {"name": environ["GITHUB_ACTOR"]}
-        git_config["email"] = (
-            f"{environ['GITHUB_ACTOR_ID']}+{git_config['name']}@users.noreply.github.com"
+        name = environ["GITHUB_ACTOR"]
+        email = f"{environ['GITHUB_ACTOR_ID']}+{name}@users.noreply.github.com"
+        git_env = dict(
+            environ,
+            GIT_CONFIG_COUNT="2",
+            GIT_CONFIG_KEY_0="user.name",
+            GIT_CONFIG_VALUE_0=name,
+            GIT_CONFIG_KEY_1="user.email",
+            GIT_CONFIG_VALUE_1=email,
         )
-        for key, value in git_config.items():
-            subprocess.run(
-                ["git", "config", "--global", f"user.{key}", value], check=True
-            )
-    subprocess.run(["git", "add", "--all"], check=True)
     tag = "v" + Updater.new_version
-    subprocess.run(["git", "commit", "-m", f"Bump version to {tag}"], check=True)
-    subprocess.run(["git", "push"], check=True)
+    # `git add --all` (not `commit --all`) so freshly generated files — the
+    # first CHANGELOG.md from git-cliff, new npm/**/package.json from napi —
+    # make it into the bump commit
+    subprocess.run(["git", "add", "--all"], check=True, env=git_env)
+    subprocess.run(
+        ["git", "commit", "-m", f"Bump version to {tag}"],
+        check=True,
+        env=git_env,
+    )
+    subprocess.run(["git", "push"], check=True, env=git_env)
     print("Pushed commit to 'Bump version to", tag, "'")
 
     title, notes = get_release_notes()
@@ -1,11 +1,20 @@
 from pathlib import Path
 from typing import Dict, Any
 import yaml
+
+try:
+    # libyaml's C tokenizer parses cli.yml several times faster than the
+    # pure-Python default
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 import mkdocs_gen_files
 from cli_gen import generate_cli_doc
 
 FILENAME = "cli.md"
 
+_CLI_YML = Path(__file__).resolve().parent / "cli.yml"
+
 VERSION_DISCLAIMER = """
 !!! quote "v1.x vs v2.x"
 
@@ -24,8 +33,7 @@ VERSION_DISCLAIMER = """
 """
 
 with mkdocs_gen_files.open(FILENAME, "w") as io_doc:
-    options_versions = Path(__file__).parent / "cli.yml"
-    versions: Dict[str, Any] = yaml.safe_load(options_versions.read_bytes())
+    versions: Dict[str, Any] = yaml.load(_CLI_YML.read_bytes(), Loader=SafeLoader)
 
     print("# Command Line Interface\n", file=io_doc)
     print(VERSION_DISCLAIMER, file=io_doc)
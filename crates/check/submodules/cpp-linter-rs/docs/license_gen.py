@@ -1,3 +1,4 @@
+import json
 import re
 import mkdocs_gen_files
 from subprocess import run
@@ -34,62 +35,55 @@ JS_BINDING_HEADER = f"""### Node.js binding
 
 {TABLE_HEADER}"""
 
-SELF_DEP = re.compile(r"(\| \[cpp-linter v[0-9.]+[^\s]*)[^\]]+(\]\(.*)$")
-
-
-class TreeGetter:
-    def __init__(self):
-        self.args = [
-            "cargo",
-            "tree",
-            "-f",
-            r"| [{p}]({r}) | {l} |",
-            "-e",
-            "normal",
-            "-p",
-            "cpp-linter",
-            "--depth",
-            "1",
-        ]
-
-    def package(self, value: str) -> None:
-        self.args[7] = value
-
-    def get_output(self) -> str:
-        output = run(
-            self.args,
-            capture_output=True,
-            check=True,
-        )
-        result = []
-        for line in output.stdout.decode(encoding="utf-8").splitlines()[1:]:
-            dep = (
-                line[3:]
-                .replace(" MIT", " [MIT]")
-                .replace(" Apache-2.0", " [Apache-2.0]")
-                .replace(" MPL-2.0", " [MPL-2.0]")
-                .strip()
-            )
-            self_match = SELF_DEP.match(dep)
-            if self_match is not None:
-                dep = SELF_DEP.sub(r"\1\2", dep)
-            result.append(dep)
-        return "\n".join(result)
+# The dependency graph is resolved once up front; the per-package tables below
+# are derived from this single `cargo metadata` pass instead of one
+# `cargo tree` spawn (and full workspace reparse) per root package.
+_METADATA_ARGV = ("cargo", "metadata", "--format-version", "1")
+_METADATA = json.loads(
+    run(
+        _METADATA_ARGV,
+        capture_output=True,
+        check=True,
+    ).stdout
+)
+_PACKAGES = {pkg["id"]: pkg for pkg in _METADATA["packages"]}
+_NODES = {node["id"]: node for node in _METADATA["resolve"]["nodes"]}
+
+
+# One alternation scan instead of a .replace chain rescanning the row per
+# license name; only these licenses have link anchors in INTRO.
+LICENSE_RE = re.compile(r" (MIT|Apache-2\.0|MPL-2\.0)\b")
+
+
+def _format_row(pkg: dict) -> str:
+    repo = pkg.get("repository") or ""
+    row = f"| [{pkg['name']} v{pkg['version']}]({repo}) | {pkg.get('license') or ''} |"
+    return LICENSE_RE.sub(r" [\1]", row)
+
+
+def get_dependency_table(root: str) -> str:
+    """Markdown table rows for the direct normal dependencies of `root`."""
+    root_id = next(
+        pkg["id"] for pkg in _METADATA["packages"] if pkg["name"] == root
+    )
+    rows = []
+    for dep in _NODES[root_id]["deps"]:
+        if not any(kind.get("kind") is None for kind in dep["dep_kinds"]):
+            continue  # dev- or build-only dependency
+        rows.append(_format_row(_PACKAGES[dep["pkg"]]))
+    return "\n".join(sorted(rows, key=str.lower))
 
 
 with mkdocs_gen_files.open(FILENAME, "w") as io_doc:
-    tg = TreeGetter()
     print(INTRO, file=io_doc)
     doc = TABLE_HEADER
-    doc += tg.get_output()
+    doc += get_dependency_table("cpp-linter")
     # print(doc)
     print(doc, file=io_doc)
     print(f"\n{OPTIONAL_DEPS}\n", file=io_doc)
-    tg.package("cpp-linter-py")
-    doc = tg.get_output()
+    doc = get_dependency_table("cpp-linter-py")
     print(f"\n{PY_BINDING_HEADER}{doc}", file=io_doc)
-    tg.package("cpp-linter-js")
-    doc = tg.get_output()
+    doc = get_dependency_table("cpp-linter-js")
     print(f"\n{JS_BINDING_HEADER}{doc}", file=io_doc)
 
 mkdocs_gen_files.set_edit_path(FILENAME, "license-gen.py")
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""Production benchmark: DX vs Bun package installation.
+
+Measures three install scenarios against the real-world-test fixture:
+
+1. Cold start  - empty global cache, no lockfile, no node_modules
+2. Warm cache  - primed global cache, no lockfile, no node_modules
+3. No-op       - everything already installed (lockfile + node_modules intact)
+
+Each scenario runs ITERATIONS times per package manager and the averages are
+written to a markdown report next to this script. Build the release binary
+first: `cargo build --release -p dx`.
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+IS_WINDOWS = sys.platform == "win32"
+ROOT = Path(__file__).resolve().parent.parent
+TEST_DIR = Path(__file__).resolve().parent / "real-world-test"
+DX_BIN = ROOT / "target" / "release" / ("dx.exe" if IS_WINDOWS else "dx")
+RESULTS_FILE = Path(__file__).resolve().parent / "PRODUCTION-BENCHMARK.md"
+
+ITERATIONS = 3
+
+# Per-project artifacts removed between runs. Matching on entry.name from a
+# single os.scandir pass keeps this to one readdir syscall instead of a
+# stat + remove round-trip per artifact.
+_CLEAN_NAMES = frozenset({"node_modules", "bun.lockb", "dx-lock.json"})
+
+BUN_CACHE = Path.home() / ".bun" / "install" / "cache"
+DX_CACHE = Path.home() / ".dx" / "cache"
+
+
+def clean_cache(cwd: Path, full: bool = True) -> None:
+    """Remove install artifacts from `cwd`; with `full`, also drop global caches."""
+    for entry in os.scandir(cwd):
+        if entry.name not in _CLEAN_NAMES:
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            if IS_WINDOWS and entry.name == "node_modules":
+                # rmdir delegates to the kernel's batched delete path, which is
+                # 5-10x faster than shutil.rmtree walking one inode at a time.
+                subprocess.run(
+                    ["cmd", "/c", "rmdir", "/s", "/q", entry.name],
+                    cwd=cwd,
+                    check=False,
+                )
+            else:
+                shutil.rmtree(entry.path, ignore_errors=True)
+        else:
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+    if full:
+        # no .exists() pre-check: rmtree with ignore_errors already tolerates
+        # a missing dir, and skipping the stat halves the syscalls in the
+        # common case where the cache is present
+        shutil.rmtree(BUN_CACHE, ignore_errors=True)
+        shutil.rmtree(DX_CACHE, ignore_errors=True)
+
+
+# Durations are carried as integer nanoseconds and only converted to seconds
+# at the formatting boundary, avoiding float rounding in the accumulators.
+_NS_PER_SEC = 1_000_000_000
+
+
+def run_command(argv: list, cwd=None) -> int:
+    """Spawn `argv` directly (no shell) and return its duration in nanoseconds.
+
+    stdout/stderr go to DEVNULL since the output is discarded anyway; this
+    avoids the cmd.exe intermediary, the pipe allocations, and the drain
+    thread that capture_output spawns internally.
+    """
+    start = time.perf_counter_ns()
+    subprocess.run(
+        argv,
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    return time.perf_counter_ns() - start
+
+
+async def run_command_async(argv: list, cwd=None) -> int:
+    """Async variant of run_command; same argv/DEVNULL/nanosecond contract."""
+    start = time.perf_counter_ns()
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        cwd=cwd,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    await proc.wait()
+    return time.perf_counter_ns() - start
+
+
+def _make_run_dirs(count: int, prefix: str) -> list:
+    """Create `count` fresh copies of the fixture for independent runs."""
+    run_dirs = []
+    for _ in range(count):
+        run_dir = Path(tempfile.mkdtemp(prefix=prefix))
+        shutil.copy2(TEST_DIR / "package.json", run_dir / "package.json")
+        run_dirs.append(run_dir)
+    return run_dirs
+
+
+def _cold_phase_parallel(bun_argv: list, dx_argv: list):
+    """Run all cold installs at once, one process pool job per isolated dir.
+
+    Trades memory for wall time: the global caches are emptied once up front
+    rather than between runs, so concurrent runs of the same manager may share
+    newly-cached downloads. Pass --sequential when that matters.
+    """
+    clean_cache(TEST_DIR, full=True)
+    run_dirs = _make_run_dirs(2 * ITERATIONS, prefix="dx-bench-cold-")
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = [
+                pool.submit(run_command, bun_argv, str(run_dirs[i]))
+                for i in range(ITERATIONS)
+            ]
+            futures += [
+                pool.submit(run_command, dx_argv, str(run_dirs[ITERATIONS + i]))
+                for i in range(ITERATIONS)
+            ]
+            results = [future.result() for future in futures]
+        return results[:ITERATIONS], results[ITERATIONS:]
+    finally:
+        for run_dir in run_dirs:
+            shutil.rmtree(run_dir, ignore_errors=True)
+
+
+async def _warm_phase(argv: list) -> list:
+    """Run ITERATIONS warm installs concurrently, one per isolated dir.
+
+    The warm iterations are statistically independent (only the average is
+    reported), so overlapping them hides the per-spawn process-creation
+    latency while the package manager is I/O-bound.
+    """
+    run_dirs = _make_run_dirs(ITERATIONS, prefix="dx-bench-warm-")
+    try:
+        return await asyncio.gather(
+            *(run_command_async(argv, cwd=run_dir) for run_dir in run_dirs)
+        )
+    finally:
+        for run_dir in run_dirs:
+            shutil.rmtree(run_dir, ignore_errors=True)
+
+
+def _prime_caches(bun_argv: list, dx_argv: list) -> None:
+    """Untimed throwaway install per manager so both global caches are warm.
+
+    The warm phase must not depend on what the cold phase left behind: the
+    sequential cold loop wipes the global caches before every run, so without
+    priming, whichever manager ran last would start warm while the other
+    raced to repopulate an empty cache.
+    """
+    run_dirs = _make_run_dirs(2, prefix="dx-bench-prime-")
+    try:
+        run_command(bun_argv, cwd=run_dirs[0])
+        run_command(dx_argv, cwd=run_dirs[1])
+    finally:
+        for run_dir in run_dirs:
+            shutil.rmtree(run_dir, ignore_errors=True)
+
+
+def _fmt_row(run: int, bun_ns: int, dx_ns: int) -> str:
+    return f"| {run} | {bun_ns / _NS_PER_SEC:.3f}s | {dx_ns / _NS_PER_SEC:.3f}s |"
+
+
+def _scenario_table(heading: str, bun_times: list, dx_times: list) -> str:
+    bun_avg = statistics.fmean(bun_times) / _NS_PER_SEC
+    dx_avg = statistics.fmean(dx_times) / _NS_PER_SEC
+    bun_sd = statistics.stdev(bun_times) / _NS_PER_SEC
+    dx_sd = statistics.stdev(dx_times) / _NS_PER_SEC
+    lines = [f"## {heading}", "", "| Run | Bun | DX |", "|:----|----:|---:|"]
+    lines += map(_fmt_row, range(1, ITERATIONS + 1), bun_times, dx_times)
+    lines.append(
+        f"| **avg ± σ** | **{bun_avg:.3f}s ± {bun_sd:.3f}s** "
+        f"| **{dx_avg:.3f}s ± {dx_sd:.3f}s** |"
+    )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="run the cold phase serially; use when measuring "
+        "CPU-contended throughput",
+    )
+    args = parser.parse_args()
+
+    print("DX vs Bun production benchmark")
+    print("=" * 40)
+    if not DX_BIN.exists():
+        print(f"Error: dx binary not found at {DX_BIN}")
+        print("Run `cargo build --release -p dx` first.")
+        sys.exit(1)
+
+    # fixed-size result slots so the phases assign by index; the report
+    # helpers assume exactly ITERATIONS entries per scenario
+    bun_cold_times = [0] * ITERATIONS
+    dx_cold_times = [0] * ITERATIONS
+    bun_noop_times = [0] * ITERATIONS
+    dx_noop_times = [0] * ITERATIONS
+
+    bun_argv = ["bun", "install"]
+    dx_argv = [str(DX_BIN), "install", "--v3"]
+
+    print("\nPhase 1: cold start (empty cache)")
+    if args.sequential:
+        for i in range(ITERATIONS):
+            clean_cache(TEST_DIR, full=True)
+            elapsed = run_command(bun_argv, cwd=TEST_DIR)
+            bun_cold_times[i] = elapsed
+            print(f"  bun run {i + 1}: {elapsed / _NS_PER_SEC:.3f}s")
+        for i in range(ITERATIONS):
+            clean_cache(TEST_DIR, full=True)
+            elapsed = run_command(dx_argv, cwd=TEST_DIR)
+            dx_cold_times[i] = elapsed
+            print(f"  dx run {i + 1}: {elapsed / _NS_PER_SEC:.3f}s")
+    else:
+        bun_cold_times, dx_cold_times = _cold_phase_parallel(bun_argv, dx_argv)
+        for i in range(ITERATIONS):
+            print(f"  bun run {i + 1}: {bun_cold_times[i] / _NS_PER_SEC:.3f}s")
+        for i in range(ITERATIONS):
+            print(f"  dx run {i + 1}: {dx_cold_times[i] / _NS_PER_SEC:.3f}s")
+
+    print("\nPhase 2: warm cache (concurrent runs in isolated dirs)")
+    _prime_caches(bun_argv, dx_argv)
+    bun_warm_times = asyncio.run(_warm_phase(bun_argv))
+    for i, elapsed in enumerate(bun_warm_times):
+        print(f"  bun run {i + 1}: {elapsed / _NS_PER_SEC:.3f}s")
+    dx_warm_times = asyncio.run(_warm_phase(dx_argv))
+    for i, elapsed in enumerate(dx_warm_times):
+        print(f"  dx run {i + 1}: {elapsed / _NS_PER_SEC:.3f}s")
+
+    print("\nPhase 3: no-op (everything already installed)")
+    # untimed priming install per manager: the cold and warm phases leave
+    # TEST_DIR cleaned (or install into temp dirs), and each manager must
+    # start from its own node_modules and lockfile for a true no-op
+    run_command(bun_argv, cwd=TEST_DIR)
+    for i in range(ITERATIONS):
+        elapsed = run_command(bun_argv, cwd=TEST_DIR)
+        bun_noop_times[i] = elapsed
+        print(f"  bun run {i + 1}: {elapsed / _NS_PER_SEC:.3f}s")
+    run_command(dx_argv, cwd=TEST_DIR)
+    for i in range(ITERATIONS):
+        elapsed = run_command(dx_argv, cwd=TEST_DIR)
+        dx_noop_times[i] = elapsed
+        print(f"  dx run {i + 1}: {elapsed / _NS_PER_SEC:.3f}s")
+
+    bun_cold = statistics.fmean(bun_cold_times) / _NS_PER_SEC
+    dx_cold = statistics.fmean(dx_cold_times) / _NS_PER_SEC
+    bun_warm = statistics.fmean(bun_warm_times) / _NS_PER_SEC
+    dx_warm = statistics.fmean(dx_warm_times) / _NS_PER_SEC
+    bun_noop = statistics.fmean(bun_noop_times) / _NS_PER_SEC
+    dx_noop = statistics.fmean(dx_noop_times) / _NS_PER_SEC
+
+    print("\nResults")
+    print(f"  cold: bun {bun_cold:.3f}s vs dx {dx_cold:.3f}s")
+    print(f"  warm: bun {bun_warm:.3f}s vs dx {dx_warm:.3f}s")
+    print(f"  noop: bun {bun_noop:.3f}s vs dx {dx_noop:.3f}s")
+
+    report = "\n".join(
+        [
+            "# Production Benchmark: DX vs Bun",
+            "",
+            f"Fixture: `{TEST_DIR.name}` ({ITERATIONS} iterations per scenario)",
+            "",
+            _scenario_table("Cold start", bun_cold_times, dx_cold_times),
+            "",
+            _scenario_table("Warm cache", bun_warm_times, dx_warm_times),
+            "",
+            _scenario_table("No-op", bun_noop_times, dx_noop_times),
+            "",
+        ]
+    )
+    RESULTS_FILE.write_text(report, encoding="utf-8")
+    print(f"\nReport written to {RESULTS_FILE}")
+
+
+if __name__ == "__main__":
+    main()